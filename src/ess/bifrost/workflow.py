@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2024 Scipp contributors (https://github.com/scipp)
 
+from functools import lru_cache
 from typing import Any
 
 import sciline
@@ -79,10 +80,17 @@ def default_parameters() -> dict[type, Any]:
     }
 
 
-def BifrostSimulationWorkflow() -> sciline.Pipeline:
-    """Data reduction workflow for simulated BIFROST data."""
+@lru_cache(maxsize=1)
+def _bifrost_simulation_workflow() -> sciline.Pipeline:
     workflow = nexus.LoadNeXusWorkflow()
     workflow.insert(get_calibrated_detector_bifrost)
     for key, val in default_parameters().items():
         workflow[key] = val
     return workflow
+
+
+def BifrostSimulationWorkflow() -> sciline.Pipeline:
+    """Data reduction workflow for simulated BIFROST data."""
+    # Building the pipeline is much more expensive than copying it,
+    # so build it once and hand out independent copies.
+    return _bifrost_simulation_workflow().copy()
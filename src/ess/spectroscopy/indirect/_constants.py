@@ -0,0 +1,12 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 Scipp contributors (https://github.com/scipp)
+"""Neutron conversion constants shared by the indirect-geometry providers"""
+
+from scipp.constants import Planck, hbar, neutron_mass
+
+# Converts slowness to wavelength, lambda = h / (m v)
+_PLANCK_PER_MASS = (Planck / neutron_mass).to(unit='angstrom*m/s')
+# Converts slowness to wavenumber, k = m v / hbar, and wavenumber to slowness
+_MASS_PER_HBAR = (neutron_mass / hbar).to(unit='s/(angstrom*m)')
+# Converts wavenumber squared to energy, E = hbar^2 k^2 / (2 m)
+_HBAR2_OVER_2M = (hbar * hbar / 2 / neutron_mass).to(unit='meV*angstrom**2')
@@ -21,6 +21,7 @@ from ..types import (
     TableMomentumTransferY,
     TableMomentumTransferZ,
 )
+from ._constants import _HBAR2_OVER_2M
 from .kf import providers as kf_providers
 from .ki import providers as ki_providers
 
@@ -120,9 +121,10 @@ def sample_table_momentum_z(q: TableMomentumTransfer) -> TableMomentumTransferZ:
 
 def energy(ki: IncidentWavenumber, kf: FinalWavenumber) -> EnergyTransfer:
     """Calculate the energy transferred to the sample by a neutron"""
-    from scipp.constants import hbar, neutron_mass
-
-    return hbar * hbar * (ki * ki - kf * kf) / 2 / neutron_mass
+    # ki and kf may have different dimensions, so the difference broadcasts them
+    transfer = ki * ki - kf * kf
+    transfer *= _HBAR2_OVER_2M
+    return transfer.to(unit='meV', copy=False)
 
 
 def energy_transfer(
@@ -18,19 +18,33 @@ from ess.spectroscopy.types import (
     SampleAnalyzerVector,
     SampleDetectorFlightTime,
     SampleDetectorPathLength,
+    SampleDetectorVector,
     SampleFrameTime,
     SamplePosition,
 )
 
+from ._constants import _HBAR2_OVER_2M, _MASS_PER_HBAR
 
-def sample_analyzer_vector(
+
+def sample_detector_vector(
+    sample_position: SamplePosition, detector_position: DetectorPosition
+) -> SampleDetectorVector:
+    """Calculate the sample-detector vector per detector element"""
+    return detector_position - sample_position
+
+
+def analyzer_reflection_vector(
     sample_position: SamplePosition,
     analyzer_position: AnalyzerPosition,
     analyzer_orientation: AnalyzerOrientation,
-    detector_position: DetectorPosition,
+    sample_detector_vec: SampleDetectorVector,
 ) -> SampleAnalyzerVector:
     """Determine the sample to analyzer-reflection-point vector per detector element
 
+    This is the provider behind `sample_analyzer_vector`, taking the
+    sample-detector vector as input so that it can be shared with
+    `analyzer_detector_vector` instead of being computed twice.
+
     Note
     ----
     The shapes of the analyzer position and orientation should be self-consistent
@@ -46,8 +60,8 @@ def sample_analyzer_vector(
         The nominal center of the central analyzer blade *surface*
     analyzer_orientation: scipp.DType.rotate3
         The orienting quaternion of the analyzer, used to identify the crystal y-axis
-    detector_position: scipp.DType.vector3
-        The position of the detector element
+    sample_detector_vec: scipp.DType.vector3
+        The vector from the sample position to each detector element
 
     Returns
     -------
@@ -55,13 +69,11 @@ def sample_analyzer_vector(
         The vector from the sample position to the interaction point on the analyzer
         for each detector element
     """
-    from scipp import dot, vector
-
     # Scipp does not distinguish between coordinates and directions, so we need to do
     # some extra legwork to ensure we can apply the orientation transformation
     # _and_ obtain a dimensionless direction vector
-    o = vector([0, 0, 0], unit=analyzer_orientation.unit)
-    y = vector(
+    o = sc.vector([0, 0, 0], unit=analyzer_orientation.unit)
+    y = sc.vector(
         [0, 1, 0], unit=analyzer_orientation.unit
     )  # and y perpendicular to the scattering plane
     yhat = analyzer_orientation * y - analyzer_orientation * o
@@ -69,13 +81,13 @@ def sample_analyzer_vector(
 
     sample_analyzer_center_vector = analyzer_position - sample_position
 
-    sample_detector_vector = detector_position - sample_position
-    sd_out_of_plane = dot(sample_detector_vector, yhat)
+    sd_out_of_plane = sc.dot(sample_detector_vec, yhat)
     # the sample-detector vector is the sum of sample-analyzer,
     # analyzer-detector-center, the out-of-plane vector
     analyzer_detector_center_vector = (
-        sample_detector_vector - sample_analyzer_center_vector - sd_out_of_plane * yhat
+        sample_detector_vec - sample_analyzer_center_vector
     )
+    analyzer_detector_center_vector -= sd_out_of_plane * yhat
 
     # TODO Consider requiring that dot(analyzer_position-sample_position, yhat) is zero?
 
@@ -90,7 +102,25 @@ def sample_analyzer_vector(
         * sd_out_of_plane
     )
 
-    return sample_analyzer_center_vector + sa_out_of_plane * yhat
+    # accumulate in place into the only per-pixel vector array we allocate here
+    sample_analyzer_vec = sa_out_of_plane * yhat
+    sample_analyzer_vec += sample_analyzer_center_vector
+    return sample_analyzer_vec
+
+
+def sample_analyzer_vector(
+    sample_position: SamplePosition,
+    analyzer_position: AnalyzerPosition,
+    analyzer_orientation: AnalyzerOrientation,
+    detector_position: DetectorPosition,
+) -> SampleAnalyzerVector:
+    """Convenience wrapper, see `analyzer_reflection_vector`"""
+    return analyzer_reflection_vector(
+        sample_position,
+        analyzer_position,
+        analyzer_orientation,
+        sample_detector_vector(sample_position, detector_position),
+    )
 
 
 def detector_geometric_a4(vec: SampleAnalyzerVector) -> DetectorGeometricA4:
@@ -107,22 +137,18 @@ def detector_geometric_a4(vec: SampleAnalyzerVector) -> DetectorGeometricA4:
     :
         The per detector element scattering angle, a4, in degrees.
     """
-    from scipp import atan2, dot, vector
-
-    lab_x = vector(
-        [1, 0, 0]
-    )  # perpendicular to the incident beam, in the horizontal plane
-    lab_z = vector([0, 0, 1])  # along the incident beam direction
-    return atan2(y=dot(lab_x, vec), x=dot(lab_z, vec)).to(unit='deg')
+    # The lab x-axis is perpendicular to the incident beam, in the horizontal plane,
+    # and the lab z-axis is along the incident beam direction. Projecting onto them
+    # is the same as reading the vector fields, which are views without copies.
+    return sc.atan2(y=vec.fields.x, x=vec.fields.z).to(unit='deg')
 
 
 def analyzer_detector_vector(
-    sample_position: SamplePosition,
+    sample_detector_vec: SampleDetectorVector,
     sample_analyzer_vec: SampleAnalyzerVector,
-    detector_position: DetectorPosition,
 ) -> AnalyzerDetectorVector:
     """Calculate the analyzer-detector vector"""
-    return detector_position - (sample_position + sample_analyzer_vec)
+    return sample_detector_vec - sample_analyzer_vec
 
 
 def kf_hat(sample_analyzer_vec: SampleAnalyzerVector) -> SampleAnalyzerDirection:
@@ -162,26 +188,24 @@ def final_wavenumber(
     :
         The magnitude of the reflected neutron wave vector for each detector element
     """
-    from scipp import sqrt
-
     # law of Cosines gives the scattering angle based on distances:
     l_sa = sc.norm(sample_analyzer_vec)
     l_ad = sc.norm(analyzer_detector_vec)
-    l_diff = sc.norm(sample_analyzer_vec + analyzer_detector_vec)
+    # only the squared sample-detector distance is needed, so skip the sqrt
+    sample_detector_vec = sample_analyzer_vec + analyzer_detector_vec
+    l_diff_squared = sc.dot(sample_detector_vec, sample_detector_vec)
     # 2 theta is measured from the direction S-A, so the internal angle is
     # (pi - 2 theta) and the normal law of Cosines is modified accordingly to be
     # -cos(2 theta) instead of cos(pi - 2 theta)
-    cos2theta = (l_diff * l_diff - l_sa * l_sa - l_ad * l_ad) / (2 * l_sa * l_ad)
+    cos2theta = (l_diff_squared - l_sa * l_sa - l_ad * l_ad) * (0.5 / (l_sa * l_ad))
 
     # law of Cosines gives the Bragg reflected wavevector magnitude
-    return tau / sqrt(2 - 2 * cos2theta)
+    return tau / sc.sqrt(2 - 2 * cos2theta)
 
 
 def final_energy(kf: FinalWavenumber) -> FinalEnergy:
     """Converts (final) wave number to (final) energy"""
-    from scipp.constants import hbar, neutron_mass
-
-    return ((hbar * hbar / 2 / neutron_mass) * kf * kf).to(unit='meV')
+    return (_HBAR2_OVER_2M * kf * kf).to(unit='meV', copy=False)
 
 
 def final_wavevector(
@@ -203,10 +227,8 @@ def secondary_flight_time(
     secondary_flight_distance: SampleDetectorPathLength, kf_magnitude: FinalWavenumber
 ) -> SampleDetectorFlightTime:
     """Calculates the most-likely time-of-flight between the sample and each pixel"""
-    from scipp.constants import hbar, neutron_mass
-
-    velocity = kf_magnitude * hbar / neutron_mass
-    return secondary_flight_distance / velocity
+    # distance / velocity with velocity = hbar k / m
+    return secondary_flight_distance * _MASS_PER_HBAR / kf_magnitude
 
 
 def sample_frame_time(
@@ -217,7 +239,8 @@ def sample_frame_time(
 
 
 providers = (
-    sample_analyzer_vector,
+    sample_detector_vector,
+    analyzer_reflection_vector,
     analyzer_detector_vector,
     kf_hat,
     final_wavenumber,
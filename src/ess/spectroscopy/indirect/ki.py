@@ -7,8 +7,14 @@ indirect geometry time-of-flight spectrometer
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+
 import scipp as sc
-from scippnexus import Group
+from choppera.nexus import primary_focus_time, primary_slowness
+from choppera.nexus import primary_pivot_time as choppera_pivot_time
+from choppera.nexus import primary_spectrometer as choppera_primary_spectrometer
+from choppera.nexus import unwrap as choppera_unwrap
+from scippnexus import Group, NXdisk_chopper, NXmoderator, NXsample, NXsource
 
 from ess.spectroscopy.types import (
     Filename,
@@ -37,17 +43,50 @@ from ess.spectroscopy.types import (
     SourceSamplePathLength,
     SourceVelocities,
 )
+from ess.spectroscopy.utils import (
+    cached_per_file,
+    component_position,
+    guide_positions,
+    in_same_unit,
+    instrument_classes,
+    member_classes,
+    open_instrument,
+    range_normalized,
+)
+
+from ._constants import _HBAR2_OVER_2M, _MASS_PER_HBAR, _PLANCK_PER_MASS
+
+
+def _unit(x: sc.Variable) -> sc.Unit:
+    return x.unit if x.bins is None else x.bins.unit
+
+
+def _dtype(x: sc.Variable) -> sc.DType:
+    """The floating point dtype of x, or float64 if x is not floating point"""
+    dtype = x.dtype if x.bins is None else x.bins.dtype
+    return dtype if dtype in (sc.DType.float32, sc.DType.float64) else sc.DType.float64
 
 
 def determine_name_with_type(
-    instrument: Group, name: str | None, options: list, type_name: str
+    instrument: Group | Mapping[str, str],
+    name: str | None,
+    options: list,
+    type_name: str,
 ) -> str:
     """Investigate an open NeXus file group for objects with matching name or base type
 
+    Note
+    ----
+    Group members are first matched by name, which only needs the member names.
+    The NeXus class of each member is only inspected, via the `options`, if no
+    member name contains `type_name`; for a scippnexus.Group only the NX_class
+    attributes are then read, without constructing the member groups.
+
     Parameter
     ---------
-    instrument: scippnexus.Group
-        The group to investigate, likely /entry/instrument
+    instrument: scippnexus.Group | Mapping[str, str]
+        The group to investigate, likely /entry/instrument, or a mapping of its
+        member names to their NeXus class names as from `instrument_classes`
     name: str
         A preferred object name, will be returned if present in the scippnexus.Group
     options: list
@@ -63,41 +102,40 @@ def determine_name_with_type(
     Raises
     ------
     ValueError
-        If no group member has the specified `name`,
-        contains the specified `type_name` or is of the specified `option` type
+        If no group member has the specified `name`, and not exactly one member
+        contains the specified `type_name` or, failing that, is of the specified
+        `option` types
     """
     if name is not None and name in instrument:
         return name
     found = {x for x in instrument if type_name in x.lower()}
-    for option in options:
-        found.update(set(instrument[option]))
+    if not found:
+        if isinstance(instrument, Group):
+            instrument = member_classes(instrument.underlying)
+        classes = {option.__name__ for option in options}
+        found.update(k for k, v in instrument.items() if v in classes)
     if len(found) != 1:
         raise ValueError(f"Could not determine {type_name} name: {found}")
     return next(iter(found))
 
 
+@cached_per_file(maxsize=32, copy=False)
 def guess_source_name(file: Filename) -> SourceName:
     """Guess the name of the source in the NeXus instrument file"""
-    from scippnexus import File, NXmoderator, NXsource
-
-    with File(file) as data:
-        instrument = data['entry/instrument']
-        name = determine_name_with_type(
-            instrument, None, [NXsource, NXmoderator], 'source'
-        )
-        return SourceName(name)
+    classes = instrument_classes(file)
+    name = determine_name_with_type(classes, None, [NXsource, NXmoderator], 'source')
+    return SourceName(name)
 
 
+@cached_per_file(maxsize=32, copy=False)
 def guess_sample_name(file: Filename) -> SampleName:
     """Guess the name of the sample in the NeXus instrument file"""
-    from scippnexus import File, NXsample
-
-    with File(file) as data:
-        instrument = data['entry/instrument']
-        name = determine_name_with_type(instrument, None, [NXsample], 'sample')
-        return SampleName(name)
+    classes = instrument_classes(file)
+    name = determine_name_with_type(classes, None, [NXsample], 'sample')
+    return SampleName(name)
 
 
+@cached_per_file(maxsize=32)
 def guess_focus_component_names(file: Filename) -> FocusComponentNames:
     """Guess the component names which define the focus of a Primary Spectrometer
 
@@ -121,47 +159,30 @@ def guess_focus_component_names(file: Filename) -> FocusComponentNames:
         The name or names of the time-focus-defining choppers, given the restrictions
         noted above
     """
-    from scipp import scalar
-    from scippnexus import File, NXdisk_chopper, compute_positions
-
-    allowance = scalar(0.5, unit='m')
-
-    with File(file) as data:
-        instrument = data['entry/instrument']
-        choppers = {
-            k: compute_positions(v[...])['position']
-            for k, v in instrument[NXdisk_chopper].items()
-        }
-
-    names = list(choppers.keys())
-    focus_names = [FocusComponentName(names[0])]
-    last = choppers[names[0]]['position']
-    distance = 0 * allowance
-    for name in names[1:]:
-        x = choppers[name]['position']
-        distance += sc.norm(x - last)
-        last = x
-        if distance <= allowance:
-            focus_names.append(FocusComponentName(name))
-        else:
-            break
-    return FocusComponentNames(focus_names)
+    allowance = sc.scalar(0.5, unit='m')
+
+    classes = instrument_classes(file)
+    names = [k for k, v in classes.items() if v == NXdisk_chopper.__name__]
+    with open_instrument(file):
+        positions = sc.concat(
+            [component_position(file, k) for k in names], dim='chopper'
+        )
+    # cumulative distance along the beamline from the first chopper, which only
+    # increases, so the choppers within the allowance are a leading subset
+    steps = sc.norm(positions['chopper', 1:] - positions['chopper', :-1])
+    distance = sc.cumsum(steps, 'chopper')
+    count = 1 + int(sc.sum(distance <= allowance.to(unit=distance.unit)).value)
+    return FocusComponentNames([FocusComponentName(n) for n in names[:count]])
 
 
 def source_position(file: Filename, source: SourceName) -> SourcePosition:
     """Extract the position of the named source from a NeXus file"""
-    from scippnexus import File, compute_positions
-
-    with File(file) as data:
-        return compute_positions(data['entry/instrument'][source][...])['position']
+    return component_position(file, source)
 
 
 def sample_position(file: Filename, sample: SampleName) -> SamplePosition:
     """Extract the position of the named sample from a NeXus file"""
-    from scippnexus import File, compute_positions
-
-    with File(file) as data:
-        return compute_positions(data['entry/instrument'][sample][...])['position']
+    return component_position(file, sample)
 
 
 def focus_distance(
@@ -193,22 +214,17 @@ def focus_distance(
         The average straight-line distance from the source position to the named
         component(s)
     """
-    from scippnexus import File, compute_positions
-
-    pos = 0 * origin
-    with File(file) as data:
-        for name in names:
-            pos += compute_positions(data['entry/instrument'][name][...])['position']
-    pos /= len(names)
-    return sc.norm(pos - origin)
+    with open_instrument(file):
+        positions = sc.concat(
+            [component_position(file, name) for name in names], dim='focus'
+        )
+    return sc.norm(positions.mean('focus') - origin)
 
 
 def focus_time(
     primary: PrimarySpectrometerObject, distance: PrimaryFocusDistance
 ) -> PrimaryFocusTime:
     """Return the time relative to the pulse time that neutrons pass the focus"""
-    from choppera.nexus import primary_focus_time
-
     return primary_focus_time(primary, distance)
 
 
@@ -222,18 +238,10 @@ def primary_path_length(
         HDF5 group entries are sorted alphabetically, so you should ensure that
         the NeXus file was constructed with this in mind.
     """
-    from scipp import concat, dot, sqrt, sum
-    from scippnexus import File, NXguide, compute_positions
-
-    with File(file) as data:
-        positions = [
-            compute_positions(v[...])['position']
-            for v in data['entry/instrument'][NXguide].values()
-        ]
-
-    positions = concat((source, *positions, sample), dim='path')
+    guides = guide_positions(file).to(unit=source.unit, copy=False)
+    positions = sc.concat((source, guides, sample), dim='path')
     diff = positions['path', 1:] - positions['path', :-1]
-    return sum(sqrt(dot(diff, diff)))
+    return sc.norm(diff).sum('path')
 
 
 def primary_spectrometer(
@@ -277,16 +285,12 @@ def primary_spectrometer(
     :
         A choppera.PrimarySpectrometer object representing the NeXus file contents
     """
-    from choppera.nexus import primary_spectrometer
-    from scippnexus import File
-
-    with File(file) as data:
-        instrument = data['entry/instrument']
+    with open_instrument(file) as instrument:
         if source not in instrument:
             raise KeyError(f"The source '{source}' is not in the instrument group")
         if sample not in instrument:
             raise KeyError(f"The sample '{sample}' is not in the instrument group")
-        return primary_spectrometer(
+        return choppera_primary_spectrometer(
             instrument, source, sample, frequency, duration, delay, velocities
         )
 
@@ -311,9 +315,7 @@ def primary_pivot_time(primary: PrimarySpectrometerObject) -> SourceSampleFlight
     :
         The determined pivot time
     """
-    from choppera.nexus import primary_pivot_time as primary_time
-
-    return primary_time(primary)
+    return choppera_pivot_time(primary)
 
 
 def unwrap_sample_time(
@@ -321,8 +323,6 @@ def unwrap_sample_time(
 ) -> SampleTime:
     """Use the pivot time to shift neutron event time offsets, recovering 'real'
     time after source pulse per event"""
-    from choppera.nexus import unwrap as choppera_unwrap
-
     return choppera_unwrap(times, frequency, least)
 
 
@@ -354,44 +354,43 @@ def incident_slowness(
         The inverse of the velocity for each neutron, that is its 'slowness', which
         is proportional to wavelength
     """
-    from ..utils import in_same_unit
-
-    tof = time - in_same_unit(focus, to=time)
-    slowness = tof / (length - distance)  # slowness _is_ inverse velocity
+    # only one event-sized array is allocated: the time-of-flight past the focus
+    # is divided in place, by the scalar focus-to-sample distance
+    focus = in_same_unit(focus, to=time).to(dtype=_dtype(time))
+    slowness = time - focus
+    slowness /= length - distance  # slowness _is_ inverse velocity
     return slowness
 
 
 def incident_sloth(
     primary: PrimarySpectrometerObject, slowness: IncidentSlowness
 ) -> IncidentSloth:
-    import scipp as sc
-    from choppera.nexus import primary_slowness
-
-    from ..utils import range_normalized
-
+    # primary_slowness returns the (minimum, maximum) pair, already in order
     min_max = primary_slowness(primary)
-    return range_normalized(slowness, sc.min(min_max), sc.max(min_max))
+    return range_normalized(slowness, min_max['slowness', 0], min_max['slowness', 1])
 
 
 def incident_wavelength(slowness: IncidentSlowness) -> IncidentWavelength:
     """Calculate the incident wavelength from the incident slowness for each neutron"""
-    from scipp.constants import Planck, neutron_mass
-
-    return (slowness * Planck / neutron_mass).to(unit='angstrom')
+    # convert the scalar constant, such that the per-event product is in angstrom
+    scale = _PLANCK_PER_MASS.to(
+        unit=sc.Unit('angstrom') / _unit(slowness), dtype=_dtype(slowness), copy=False
+    )
+    return slowness * scale
 
 
 def incident_wavenumber(slowness: IncidentSlowness) -> IncidentWavenumber:
     """Calculate the incident wave number from the incident slowness for each neutron"""
-    from scipp.constants import hbar, neutron_mass
-
-    return (neutron_mass / hbar / slowness).to(unit='1/angstrom')
+    # convert the scalar constant, such that the per-event quotient is in 1/angstrom
+    scale = _MASS_PER_HBAR.to(
+        unit=sc.Unit('1/angstrom') * _unit(slowness), dtype=_dtype(slowness), copy=False
+    )
+    return scale / slowness
 
 
 def incident_direction() -> IncidentDirection:
     """Return the incident neutron direction in the laboratory frame"""
-    from scipp import vector
-
-    return vector([0, 0, 1.0])
+    return sc.vector([0, 0, 1.0])
 
 
 def incident_wavevector(
@@ -403,9 +402,12 @@ def incident_wavevector(
 
 def incident_energy(ki: IncidentWavenumber) -> IncidentEnergy:
     """Convert the incident wavenumber to incident energy in meV"""
-    from scipp.constants import hbar, neutron_mass
-
-    return ((hbar * hbar / 2 / neutron_mass) * ki * ki).to(unit='meV')
+    scale = _HBAR2_OVER_2M.to(
+        unit=sc.Unit('meV') / _unit(ki) ** 2, dtype=_dtype(ki), copy=False
+    )
+    energy = ki * scale
+    energy *= ki
+    return energy
 
 
 providers = (
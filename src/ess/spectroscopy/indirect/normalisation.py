@@ -1,7 +1,15 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2024 Scipp contributors (https://github.com/scipp)
 
-from scipp import DataArray
+import numpy as np
+import scipp as sc
+from choppera.nexus import (
+    primary_pivot_time_at,
+    primary_slowness,
+    unwrap,
+    unwrap_histogram,
+)
+from scipp import DataArray, lookup
 
 from ..types import (
     Filename,
@@ -25,26 +33,24 @@ from ..types import (
     WavelengthEvents,
     WavelengthMonitor,
 )
+from ..utils import component_position, guide_positions, in_same_unit, range_normalized
+from ._constants import _PLANCK_PER_MASS
 
 
 def incident_monitor_normalization(
     slowness: IncidentSlowness, monitor: SlownessMonitor
 ) -> MonitorNormalisation:
     """For each event, return the corresponding monitor intensity"""
-    from scipp import lookup
-
-    coords = list(monitor.coords)
-    if len(coords) != 1:
-        raise ValueError(f'Monitor expected to have exactly 1 coordinate, has {coords}')
-    return lookup(monitor, dim=coords[0])[slowness]
+    if monitor.ndim != 1:
+        raise ValueError(
+            f'Monitor expected to have exactly 1 dimension, has {monitor.dims}'
+        )
+    return lookup(monitor, dim=monitor.dim)[slowness]
 
 
 def monitor_position(file: Filename, monitor: MonitorName) -> MonitorPosition:
     """Extract the position of the named monitor from a NeXus file"""
-    from scippnexus import File, compute_positions
-
-    with File(file) as data:
-        return compute_positions(data['entry/instrument'][monitor][...])['position']
+    return component_position(file, monitor)
 
 
 def source_monitor_path_length(
@@ -57,36 +63,23 @@ def source_monitor_path_length(
         HDF5 group entries are sorted alphabetically, so you should ensure that
         the NeXus file was constructed with this in mind.
     """
-    import scipp as sc
-    from scippnexus import File, NXguide, compute_positions
-
-    with File(file) as data:
-        positions = [
-            compute_positions(v[...])['position']
-            for v in data['entry/instrument'][NXguide].values()
-        ]
-
     # Find the closest guide to the monitor position, ignoring the possibility that
     # a guide could be _beyond_ the monitor _and_ closest :(
-    closest = 0
-    distance = sc.norm(source - monitor)
-    for i, position in enumerate(positions):
-        d = sc.norm(position - monitor)
-        if d < distance:
-            distance = d
-            closest = i
-
-    positions = sc.concat((source, *positions[:closest], monitor), dim='path')
+    # The source is the first candidate, so that it is kept if no guide is closer
+    guides = guide_positions(file).to(unit=source.unit, copy=False)
+    candidates = sc.concat((source, guides), dim='path')
+    nearest = int(np.argmin(sc.norm(candidates - monitor).values))
+    closest = max(nearest - 1, 0)
+
+    positions = sc.concat((candidates['path', : closest + 1], monitor), dim='path')
     diff = positions['path', 1:] - positions['path', :-1]
-    return sc.sum(sc.norm(diff))
+    return sc.norm(diff).sum('path')
 
 
 def monitor_pivot_time(
     primary: PrimarySpectrometerObject, length: SourceMonitorPathLength
 ) -> SourceMonitorFlightTime:
     """Find the pivot time between source-pulse arrival times at the monitor position"""
-    from choppera.nexus import primary_pivot_time_at
-
     return primary_pivot_time_at(primary, length)
 
 
@@ -114,22 +107,19 @@ def monitor_wall_time(
         The same intensities with independent axis converted to the likely time since
         neutron-producing proton pulse
     """
-    from choppera.nexus import unwrap, unwrap_histogram
-
     frame = 'frame_time'
     if frame not in monitor.coords:
         raise RuntimeError(f'A FrameTimeMonitor must have coordinate "{frame}"')
     wall = 'wall_time'
-    names = {frame: wall}
     if monitor.coords.is_edges(frame, dim=frame):
         coord, values = unwrap_histogram(
             monitor.coords[frame], monitor.data, frequency, least
         )
     else:
         values = monitor.data
-        coord = unwrap(monitor.coord[frame], frequency, least)
+        coord = unwrap(monitor.coords[frame], frequency, least)
 
-    return DataArray(values.rename(names), coords={wall: coord.rename(names)})
+    return DataArray(values, coords={wall: coord}).rename_dims({frame: wall})
 
 
 def monitor_slowness(
@@ -160,17 +150,15 @@ def monitor_slowness(
         The same intensities with independent axis converted to the inverse velocity
         of the neutrons, which scales linearly with wall time
     """
-    from ..utils import in_same_unit
-
     wall = 'wall_time'
     if wall not in monitor.coords:
         raise RuntimeError(f'A WallTimeMonitor must have coordinate "{wall}"')
     slow = 'slowness'
-    names = {wall: slow}
     wall_time = monitor.coords[wall]
-    duration = wall_time - in_same_unit(focus, to=wall_time)
-    slowness = (duration / (length - distance)).rename(names).to(unit='s/m')
-    return DataArray(monitor.data.rename(names), coords={slow: slowness})
+    slowness = wall_time - in_same_unit(focus, to=wall_time)
+    slowness /= length - distance
+    slowness = slowness.to(unit='s/m', copy=False)
+    return DataArray(monitor.data, coords={slow: slowness}).rename_dims({wall: slow})
 
 
 def monitor_wavelength(monitor: SlownessMonitor) -> WavelengthMonitor:
@@ -188,20 +176,18 @@ def monitor_wavelength(monitor: SlownessMonitor) -> WavelengthMonitor:
     :
         The same intensities with independent axis converted to wavelength
     """
-    from scipp.constants import Planck, neutron_mass
-
-    c = Planck / neutron_mass
     slow = 'slowness'
-    # wavelength = 'incident_wavelength'
+    wavelength = 'incident_wavelength'
     if slow not in monitor.coords:
         raise RuntimeError(f'A SlownessMonitor must have the coordinate "{slow}"')
 
-    def converter(slowness):
-        return (c * slowness).to(unit='angstrom')
-
-    # names = {slow: wavelength}
-    converted = monitor.transform_coords(incident_wavelength=converter)
-    return converted
+    # equivalent to transform_coords for this one-to-one conversion: the new
+    # coordinate replaces slowness as the dimension, which is kept unaligned
+    # the constant is in angstrom*m/s, so no conversion is needed for s/m slowness
+    coord = (_PLANCK_PER_MASS * monitor.coords[slow]).to(unit='angstrom', copy=False)
+    converted = monitor.assign_coords({wavelength: coord})
+    converted.coords.set_aligned(slow, False)
+    return converted.rename_dims({slow: wavelength})
 
 
 def monitor_sloth(
@@ -225,19 +211,13 @@ def monitor_sloth(
         The same intensities with independent axis converted to the sloth,
         which is the normalised slowness, inverse velocity, and incident wavelength
     """
-    import scipp as sc
-    from choppera.nexus import primary_slowness
-
-    from ..utils import range_normalized
-
     slow = 'slowness'
     if slow not in monitor.coords:
         raise RuntimeError(f'A SlownessMonitor must have the coordinate "{slow}"')
     sloth = 'sloth'
-    names = {slow: sloth}
     min_max = primary_slowness(primary)
-    normed = range_normalized(monitor.coords[slow], sc.min(min_max), sc.max(min_max))
-    return DataArray(monitor.data.rename(names), coords={sloth: normed.rename(names)})
+    normed = range_normalized(monitor.coords[slow], min_max[slow, 0], min_max[slow, 1])
+    return DataArray(monitor.data, coords={sloth: normed}).rename_dims({slow: sloth})
 
 
 def normalise(
@@ -262,23 +242,28 @@ def normalise(
     :
         Event data binned by sloth, with a coordinate that is the per-bin normalization
     """
-    from scipp import lookup
-
     dim = 'incident_wavelength'
-    centres = (edges[:-1] + edges[1:]) / 2
-    variances = None
-    if monitor.variances is not None:
-        monitor = monitor.copy()
-        variances = monitor.copy()
-        variances.values = monitor.variances
-        monitor.variances = None
-        variances.variances = None
-    counts = lookup(monitor, dim)[centres]
-    if variances is not None:
+    centres = sc.midpoints(edges, dim=dim)
+    if monitor.variances is not None and monitor.variances.any():
         # Bad form, maybe. But two events with the same sloth bin are normalized
         # by the same monitor counts -- which has a known uncertainty -- and scipp
         # refuses to allow lookup on data which has variances defined.
-        counts.variances = (lookup(variances, dim)[centres]).values
+        # Stack the values and variances so that a single lookup finds both.
+        part = 'monitor_part'
+        stacked = sc.array(
+            dims=[part, *monitor.dims],
+            values=np.stack([monitor.values, monitor.variances]),
+            unit=monitor.unit,
+        )
+        table = DataArray(stacked, coords=monitor.coords, masks=monitor.masks)
+        found = lookup(table, dim)[centres]
+        counts = found[part, 0].copy()
+        counts.variances = found[part, 1].values
+    else:
+        # all-zero variances are exact counts
+        if monitor.variances is not None:
+            monitor = sc.values(monitor)
+        counts = lookup(monitor, dim)[centres]
 
     binned = events.bin(**{dim: edges})
     binned.coords['monitor'] = counts
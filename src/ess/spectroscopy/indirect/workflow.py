@@ -25,6 +25,7 @@ from ..types import (
     PreopenNeXusFile,
     SampleRun,
 )
+from ..utils import open_instrument
 
 PIXEL_NAME = 'detector_number'
 
@@ -311,36 +312,29 @@ def get_triplet_events(triplets: Iterable[sc.DataArray]):
 
 def get_sample_events(triplet_events, sample_detector_flight_times):
     """Return the events with the frame_time coordinate offset to time at the sample"""
-    events = triplet_events.copy()
-    for coord in ('position', 'x_pixel_offset', 'y_pixel_offset'):
-        del events.coords[coord]
+    # drop the pixel coordinates before copying, so they are not copied at all
+    events = triplet_events.drop_coords(
+        ['position', 'x_pixel_offset', 'y_pixel_offset']
+    ).copy()
     events.bins.coords['frame_time'] -= sample_detector_flight_times.to(unit='ns')
     events.bins.coords['frame_time'] %= ess_source_period()
     return events
 
 
-def get_unwrapped_events(
-    filename, source_name, sample_name, sample_events, focus_components
-):
-    """Shift frame_time at sample events to time-since-pulse events at sample"""
-    from sciline import Pipeline
-
+def _primary_params(filename, source_name, sample_name, focus_components):
+    """Return the sciline parameters which define the primary spectrometer"""
     from ..types import (
         Filename,
         FocusComponentNames,
-        PrimarySpectrometerObject,
-        SampleFrameTime,
         SampleName,
-        SampleTime,
         SourceDelay,
         SourceDuration,
         SourceFrequency,
         SourceName,
         SourceVelocities,
     )
-    from .ki import providers as ki_providers
 
-    params = {
+    return {
         Filename: filename,
         SampleName: sample_name,
         SourceName: source_name,
@@ -348,11 +342,42 @@ def get_unwrapped_events(
         SourceDuration: ess_source_duration(),
         SourceFrequency: ess_source_frequency(),
         SourceVelocities: ess_source_velocities(),
-        SampleFrameTime: sample_events.data.bins.coords['frame_time'],
         FocusComponentNames: focus_components,
     }
+
+
+def get_primary_spectrometer(filename, source_name, sample_name, focus_components):
+    """Construct the choppera primary spectrometer described by the NeXus file
+
+    The primary spectrometer does not depend on the (a3, a4) setting, so it can be
+    constructed once and reused for the events of every setting.
+    """
+    from sciline import Pipeline
+
+    from ..types import PrimarySpectrometerObject
+    from .ki import providers as ki_providers
+
+    params = _primary_params(filename, source_name, sample_name, focus_components)
+    return Pipeline(ki_providers, params=params).compute(PrimarySpectrometerObject)
+
+
+def get_unwrapped_events(
+    filename, source_name, sample_name, sample_events, focus_components, primary=None
+):
+    """Shift frame_time at sample events to time-since-pulse events at sample
+
+    The primary spectrometer is constructed from the file unless it is provided.
+    """
+    from sciline import Pipeline
+
+    from ..types import PrimarySpectrometerObject, SampleFrameTime, SampleTime
+    from .ki import providers as ki_providers
+
+    params = _primary_params(filename, source_name, sample_name, focus_components)
+    params[SampleFrameTime] = sample_events.data.bins.coords['frame_time']
     pipeline = Pipeline(ki_providers, params=params)
-    primary = pipeline.get(PrimarySpectrometerObject).compute()
+    if primary is None:
+        primary = pipeline.get(PrimarySpectrometerObject).compute()
     pipeline[PrimarySpectrometerObject] = primary
     params[PrimarySpectrometerObject] = primary
 
@@ -388,14 +413,18 @@ def get_normalization_monitor(monitors, monitor_component, collapse: bool = Fals
         # This is very specialized to how the simulated scans are done,
         # it needs to be generalized?
         normalization = normalization.sum(dim='time')
-    # rescale the frame_time axis. Why does it need to be done this way?
-    return normalization.transform_coords(
-        ['frame_time'], graph={'frame_time': lambda t: t.to(unit='nanosecond')}
-    )
+    # rescale the frame_time axis, unless it is already in nanoseconds
+    frame_time = normalization.coords['frame_time']
+    if frame_time.unit == 'ns':
+        return normalization
+    return normalization.assign_coords(frame_time=frame_time.to(unit='ns'))
 
 
-def get_energy_axes(ki_params, kf_params):
-    """Extract incident_energy, final_energy, and energy_transfer
+def get_conservation_pipeline(ki_params, kf_params):
+    """Construct the energy and momentum conservation pipeline for one setting
+
+    The per-event incident and final wavenumbers are computed once and stored in
+    the pipeline, so that every energy and momentum axis derived from it reuses them.
 
     Parameters
     ----------
@@ -406,22 +435,12 @@ def get_energy_axes(ki_params, kf_params):
 
     Returns
     -------
-    ei:
-        The incident energy
-    en:
-        The energy transfer
-    ef:
-        The final energy
+    :
+        The conservation pipeline with the incident and final wavenumbers set
     """
     from sciline import Pipeline
 
-    from ..types import (
-        EnergyTransfer,
-        FinalEnergy,
-        FinalWavenumber,
-        IncidentEnergy,
-        IncidentWavenumber,
-    )
+    from ..types import FinalWavenumber, IncidentWavenumber
     from .conservation import providers
 
     params = {}
@@ -430,13 +449,42 @@ def get_energy_axes(ki_params, kf_params):
     pipeline = Pipeline(providers, params=params)
     pipeline[IncidentWavenumber] = pipeline.get(IncidentWavenumber).compute()
     pipeline[FinalWavenumber] = pipeline.get(FinalWavenumber).compute()
+    return pipeline
+
+
+def get_energy_axes(ki_params, kf_params, pipeline=None):
+    """Extract incident_energy, final_energy, and energy_transfer
+
+    Parameters
+    ----------
+    ki_params:
+        A dictionary of parameters needed by the incident-spectrometer sciline pipeline
+    kf_params:
+        A dictionary of parameters needed by the secondary-spectrometer sciline pipeline
+    pipeline:
+        The conservation pipeline from `get_conservation_pipeline`, which is
+        constructed from the parameters if not provided
+
+    Returns
+    -------
+    ei:
+        The incident energy
+    en:
+        The energy transfer
+    ef:
+        The final energy
+    """
+    from ..types import EnergyTransfer, FinalEnergy, IncidentEnergy
+
+    if pipeline is None:
+        pipeline = get_conservation_pipeline(ki_params, kf_params)
     ei = pipeline.get(IncidentEnergy).compute()
     en = pipeline.get(EnergyTransfer).compute()
     ef = pipeline.get(FinalEnergy).compute()
     return ei, en, ef
 
 
-def add_momentum_axes(ki_params, kf_params, events, a3: Variable):
+def add_momentum_axes(ki_params, kf_params, events, a3: Variable, pipeline=None):
     """Extract momentum transfer in the lab and sample-table coordinate systems
 
     Parameters
@@ -449,6 +497,9 @@ def add_momentum_axes(ki_params, kf_params, events, a3: Variable):
         The event data to which the calculated momentum components are appended
     a3:
         The scalar value of the sample rotation angle describing the events
+    pipeline:
+        The conservation pipeline from `get_conservation_pipeline`, which is
+        constructed from the parameters if not provided. It is not modified.
 
     Returns
     -------
@@ -459,8 +510,6 @@ def add_momentum_axes(ki_params, kf_params, events, a3: Variable):
         These new coordinates are named 'lab_momentum_x', 'lab_momentum_z',
         'table_momentum_x' and 'table_momentum_z'
     """
-    from sciline import Pipeline
-
     from ..types import (
         LabMomentumTransfer,
         LabMomentumTransferX,
@@ -470,18 +519,17 @@ def add_momentum_axes(ki_params, kf_params, events, a3: Variable):
         TableMomentumTransferX,
         TableMomentumTransferZ,
     )
-    from .conservation import providers
 
     if a3.size != 1:
         raise ValueError(f'Expected a3 to have 1-entry, not {a3.size}')
 
-    params = {}
-    # First we must add the lab momentum vector, since it is not a3 dependent
-    params.update(ki_params)
-    params.update(kf_params)
-    params[SampleTableAngle] = a3
+    if pipeline is None:
+        pipeline = get_conservation_pipeline(ki_params, kf_params)
+    else:
+        pipeline = pipeline.copy()
+    pipeline[SampleTableAngle] = a3
 
-    pipeline = Pipeline(providers, params=params)
+    # First we must add the lab momentum vector, since it is not a3 dependent
     pipeline[LabMomentumTransfer] = pipeline.get(LabMomentumTransfer).compute()
 
     events.bins.coords['lab_momentum_x'] = pipeline.get(LabMomentumTransferX).compute()
@@ -762,18 +810,30 @@ def load_everything(filename: Filename):
 
 
 def one_setting(
-    sample, triplet_events, analyzers, norm_monitor, filename, names, warn_about_a3=True
+    sample,
+    triplet_events,
+    analyzers,
+    norm_monitor,
+    filename,
+    names,
+    warn_about_a3=True,
+    primary=None,
 ):
-    """Calculate the event properties for a single (a3, a4) setting"""
+    """Calculate the event properties for a single (a3, a4) setting
+
+    The primary spectrometer is shared by all settings, and is constructed from
+    the file unless it is provided.
+    """
     detector_positions = triplet_events.coords['position']
     kf_params, sample_detector_flight_time = find_sample_detector_flight_time(
         sample, analyzers, detector_positions
     )
     events = get_sample_events(triplet_events, sample_detector_flight_time)
     ki_params, unwrapped_events, primary = get_unwrapped_events(
-        filename, names['source'], names['sample'], events, names['focus']
+        filename, names['source'], names['sample'], events, names['focus'], primary
     )
-    ei, en, ef = get_energy_axes(ki_params, kf_params)
+    conservation = get_conservation_pipeline(ki_params, kf_params)
+    ei, en, ef = get_energy_axes(ki_params, kf_params, conservation)
 
     events.bins.coords['energy_transfer'] = en.to(unit='meV')
     events.bins.coords['incident_energy'] = ei
@@ -792,7 +852,7 @@ def one_setting(
             logger.warning("No a3 present in setting, assuming 0 a3")
         a3 = scalar(0, unit='deg')
 
-    events = add_momentum_axes(ki_params, kf_params, events, a3)
+    events = add_momentum_axes(ki_params, kf_params, events, a3, conservation)
 
     # Set up the normalisation by adding a 'incident_wavelength' coordinate to
     # the individual events and the normalisation monitor
@@ -970,19 +1030,28 @@ def bifrost(
         filename, named_components, is_simulated
     )
     settings = split(triplet_events, analyzers, norm_monitor, logs)
-    data = [
-        one_setting(
-            sample,
-            one_triplet_events,
-            one_analyzers,
-            one_monitor,
+    # keep the file open for all providers which read instrument information
+    with open_instrument(filename):
+        primary = get_primary_spectrometer(
             filename,
-            named_components,
-        )
-        for one_triplet_events, one_analyzers, one_monitor in tqdm(
-            settings, desc='(a3, a4) settings'
+            named_components['source'],
+            named_components['sample'],
+            named_components['focus'],
         )
-    ]
+        data = [
+            one_setting(
+                sample,
+                one_triplet_events,
+                one_analyzers,
+                one_monitor,
+                filename,
+                named_components,
+                primary=primary,
+            )
+            for one_triplet_events, one_analyzers, one_monitor in tqdm(
+                settings, desc='(a3, a4) settings'
+            )
+        ]
     return {k: concat([d[k] for d in data], 'setting') for k in data[0]}
 
 
@@ -1040,15 +1109,16 @@ def bifrost_single(
     if 'time' in norm_monitor.sizes:
         norm_monitor = norm_monitor.sum('time')
 
-    data = one_setting(
-        sample,
-        triplet_events,
-        analyzers,
-        norm_monitor,
-        filename,
-        named_components,
-        warn_about_a3=False,
-    )
+    with open_instrument(filename):
+        data = one_setting(
+            sample,
+            triplet_events,
+            analyzers,
+            norm_monitor,
+            filename,
+            named_components,
+            warn_about_a3=False,
+        )
 
     if extras:
         data['sample'] = sample
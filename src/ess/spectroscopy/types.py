@@ -64,6 +64,7 @@ SamplePosition = variable_type('SamplePosition')
 SourcePosition = variable_type('SourcePosition')
 AnalyzerOrientation = variable_type('AnalyzerOrientation')
 SampleAnalyzerVector = variable_type('SampleAnalyzerVector')
+SampleDetectorVector = variable_type('SampleDetectorVector')
 AnalyzerDetectorVector = variable_type('AnalyzerDetectorVector')
 SampleAnalyzerDirection = variable_type('SampleAnalyzerDirection')
 ReciprocalLatticeVectorAbsolute = variable_type('ReciprocalLatticeVectorAbsolute')
@@ -1,7 +1,21 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2024 Scipp contributors (https://github.com/scipp)
 
-from scipp import DataArray, Variable
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+
+import h5py
+import numpy as np
+from scipp import DataArray, DataGroup, Variable, concat, vectors
+from scippnexus import File, Group, NXguide, compute_positions
+
+# Open NeXus files shared by nested `open_instrument` contexts,
+# keyed by real path with values [file handle, number of active contexts]
+_open_files: dict[str, list] = {}
+_open_files_lock = threading.Lock()
 
 
 def in_same_unit(b: Variable, to: Variable | None = None) -> Variable:
@@ -48,3 +62,128 @@ def range_normalized(variable: Variable, minimum: Variable, maximum: Variable):
 
 def is_in_coords(x: DataArray, name: str):
     return name in x.coords or (x.bins is not None and name in x.bins.coords)
+
+
+@contextmanager
+def open_instrument(file) -> Iterator[Group]:
+    """Open the 'entry/instrument' group of a NeXus file, reusing an open handle
+
+    Nested contexts for the same file share one open handle, which is closed
+    when the outermost context exits. Wrapping a pipeline computation in this
+    context therefore opens the file once for all providers that read from it,
+    instead of once per provider.
+
+    Parameters
+    ----------
+    file:
+        The NeXus file name, or anything else accepted by `scippnexus.File`;
+        only file names are shared between contexts
+
+    Returns
+    -------
+    :
+        The 'entry/instrument' group of the open file
+    """
+    if not isinstance(file, str | os.PathLike):
+        with File(file) as data:
+            yield data['entry/instrument']
+        return
+
+    key = os.path.realpath(file)
+    with _open_files_lock:
+        if key not in _open_files:
+            _open_files[key] = [File(file), 0]
+        handle = _open_files[key]
+        handle[1] += 1
+    try:
+        yield handle[0]['entry/instrument']
+    finally:
+        with _open_files_lock:
+            handle[1] -= 1
+            if handle[1] == 0:
+                del _open_files[key]
+                handle[0].close()
+
+
+def cached_per_file(maxsize: int, copy: bool = True):
+    """Memoize a function of a NeXus file name and further hashable arguments
+
+    The first argument of the function is the NeXus file name, or anything else
+    accepted by `scippnexus.File`. Results for file names are cached per real path,
+    modification time and remaining arguments, so each file is read once until it
+    is modified. Other file inputs, e.g., open HDF5 groups, are passed through
+    uncached.
+
+    Parameters
+    ----------
+    maxsize:
+        The maximum number of cached results, see `functools.lru_cache`
+    copy:
+        If true, each call returns a `copy()` of the cached result, so callers
+        can not modify the cached value; immutable results need no copy
+    """
+
+    def decorator(func):
+        @lru_cache(maxsize=maxsize)
+        def cached(path: str, mtime: int, *args):
+            return func(path, *args)
+
+        @wraps(func)
+        def wrapper(file, *args):
+            if not isinstance(file, str | os.PathLike):
+                return func(file, *args)
+            path = os.path.realpath(file)
+            result = cached(path, os.stat(path).st_mtime_ns, *args)
+            return result.copy() if copy else result
+
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+
+    return decorator
+
+
+@cached_per_file(maxsize=256)
+def component_position(file, name: str) -> Variable:
+    """Extract the position of a named component from the NeXus instrument group"""
+    with open_instrument(file) as instrument:
+        return compute_positions(instrument[name][...])['position']
+
+
+@cached_per_file(maxsize=32)
+def instrument_classes(file) -> dict[str, str]:
+    """Map the members of the NeXus 'entry/instrument' group to their NX_class names,
+    which are empty for members without an NX_class attribute"""
+    # reuses a handle already shared by `open_instrument`, and reads the
+    # attributes through h5py rather than constructing scippnexus groups
+    with open_instrument(file) as instrument:
+        return member_classes(instrument.underlying)
+
+
+@cached_per_file(maxsize=32)
+def guide_positions(file) -> Variable:
+    """Return the positions of all NXguide components in the NeXus instrument group,
+    along a 'path' dimension in the order of the guides in the group"""
+    names = [k for k, v in instrument_classes(file).items() if v == NXguide.__name__]
+    if not names:
+        return vectors(dims=['path'], values=np.empty((0, 3)), unit='m')
+    with open_instrument(file) as instrument:
+        guides = DataGroup({k: instrument[k][...] for k in names})
+    # resolve all guide transformation chains in one pass
+    guides = compute_positions(guides)
+    return concat([guide['position'] for guide in guides.values()], dim='path')
+
+
+def member_classes(group: h5py.Group) -> dict[str, str]:
+    """Map the subgroups of an HDF5 group to their NeXus class names
+
+    Only the NX_class attribute of each direct member is read; members without
+    one map to an empty string, and datasets are skipped.
+    """
+    classes = {}
+    for name, member in group.items():
+        if isinstance(member, h5py.Group):
+            nx_class = member.attrs.get('NX_class', '')
+            if isinstance(nx_class, bytes):
+                nx_class = nx_class.decode()
+            classes[name] = nx_class
+    return classes
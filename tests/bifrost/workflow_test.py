@@ -68,3 +68,13 @@ def test_simulation_workflow_can_load_choppers() -> None:
     assert 'position' in first
     assert 'rotation_speed' in first
     assert first['slit_edges'].shape == (2,)
+
+
+def test_simulation_workflow_returns_independent_pipelines() -> None:
+    workflow = bifrost.BifrostSimulationWorkflow()
+    workflow[Filename[SampleRun]] = 'first.nxs'
+    other = bifrost.BifrostSimulationWorkflow()
+    other[Filename[SampleRun]] = 'second.nxs'
+
+    assert workflow.compute(Filename[SampleRun]) == 'first.nxs'
+    assert other.compute(Filename[SampleRun]) == 'second.nxs'
@@ -0,0 +1,47 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 Scipp contributors (https://github.com/scipp)
+
+import h5py
+import pytest
+
+# (name, NX_class, distance along the beam in m)
+COMPONENTS = (
+    ('001_source', 'NXmoderator', 0.0),
+    ('003_guide', 'NXguide', 2.0),
+    ('005_chopper', 'NXdisk_chopper', 6.0),
+    ('006_chopper', 'NXdisk_chopper', 6.2),
+    ('007_guide', 'NXguide', 10.0),
+    ('019_chopper', 'NXdisk_chopper', 20.0),
+    ('050_guide', 'NXguide', 80.0),
+    ('110_frame_monitor', 'NXmonitor', 150.0),
+    ('114_sample_stack', 'NXsample', 162.0),
+)
+
+
+def _write_component(instrument, name, nx_class, z):
+    group = instrument.create_group(name)
+    group.attrs['NX_class'] = nx_class
+    transformations = group.create_group('transformations')
+    transformations.attrs['NX_class'] = 'NXtransformations'
+    translation = transformations.create_dataset('translation', data=z)
+    translation.attrs['units'] = 'm'
+    translation.attrs['vector'] = [0.0, 0.0, 1.0]
+    translation.attrs['transformation_type'] = 'translation'
+    translation.attrs['depends_on'] = '.'
+    group['depends_on'] = 'transformations/translation'
+    if nx_class == 'NXmonitor':
+        data = group.create_dataset('data', data=[1.0, 2.0, 3.0])
+        data.attrs['units'] = 'counts'
+
+
+@pytest.fixture
+def nexus_file(tmp_path):
+    filename = tmp_path / 'instrument.h5'
+    with h5py.File(filename, 'w') as f:
+        entry = f.create_group('entry')
+        entry.attrs['NX_class'] = 'NXentry'
+        instrument = entry.create_group('instrument')
+        instrument.attrs['NX_class'] = 'NXinstrument'
+        for name, nx_class, z in COMPONENTS:
+            _write_component(instrument, name, nx_class, z)
+    return str(filename)
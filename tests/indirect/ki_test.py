@@ -0,0 +1,143 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 Scipp contributors (https://github.com/scipp)
+
+import h5py
+import pytest
+import scipp as sc
+
+from ess.spectroscopy.indirect import ki
+
+from .conftest import COMPONENTS
+
+
+def test_guess_focus_component_names_groups_nearby_choppers(nexus_file):
+    names = ki.guess_focus_component_names(nexus_file)
+    assert names == ['005_chopper', '006_chopper']
+
+
+def test_primary_path_length_follows_guides(nexus_file):
+    source = ki.source_position(nexus_file, ki.guess_source_name(nexus_file))
+    sample = ki.sample_position(nexus_file, ki.guess_sample_name(nexus_file))
+    length = ki.primary_path_length(nexus_file, source, sample)
+    assert sc.identical(length, sc.scalar(162.0, unit='m'))
+
+
+def test_focus_distance_is_mean_component_distance(nexus_file):
+    source = ki.source_position(nexus_file, ki.guess_source_name(nexus_file))
+    names = ['005_chopper', '006_chopper']
+    distance = ki.focus_distance(nexus_file, source, names)
+    assert sc.allclose(distance, sc.scalar(6.1, unit='m'))
+
+
+def test_determine_name_with_type_prefers_name_matches(nexus_file):
+    from scippnexus import File, NXguide, NXsample
+
+    with File(nexus_file) as f:
+        instrument = f['entry/instrument']
+        assert ki.determine_name_with_type(instrument, '003_guide', [], 'x') == (
+            '003_guide'
+        )
+        # a unique name match is used without looking at the NeXus classes
+        assert (
+            ki.determine_name_with_type(instrument, None, [NXguide], 'source')
+            == '001_source'
+        )
+        # the NeXus classes are used if no name matches
+        assert (
+            ki.determine_name_with_type(instrument, None, [NXsample], 'specimen')
+            == '114_sample_stack'
+        )
+        with pytest.raises(ValueError, match='Could not determine guide name'):
+            ki.determine_name_with_type(instrument, None, [], 'guide')
+
+
+def test_open_instrument_opens_file_once_for_nested_contexts(nexus_file, monkeypatch):
+    from ess.spectroscopy import utils
+
+    opened = []
+    original = utils.File
+
+    def counting_file(*args, **kwargs):
+        opened.append(args[0])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(utils, 'File', counting_file)
+    with utils.open_instrument(nexus_file):
+        with utils.open_instrument(nexus_file) as instrument:
+            assert '001_source' in instrument
+        source = ki.source_position(nexus_file, '001_source')
+        sample = ki.sample_position(nexus_file, '114_sample_stack')
+        ki.primary_path_length(nexus_file, source, sample)
+    assert len(opened) == 1
+    # cached results do not need the file again
+    ki.primary_path_length(nexus_file, source, sample)
+    assert len(opened) == 1
+    # once the outermost context exits, the next context opens the file again
+    with utils.open_instrument(nexus_file):
+        pass
+    assert len(opened) == 2
+
+
+def test_guess_focus_component_names_is_cached_per_file(nexus_file, monkeypatch):
+    from ess.spectroscopy import utils
+
+    names = ki.guess_focus_component_names(nexus_file)
+    names.append('modified by the caller')
+
+    def failing_file(*args, **kwargs):
+        raise AssertionError('the file should not be opened again')
+
+    monkeypatch.setattr(utils, 'File', failing_file)
+    assert ki.guess_focus_component_names(nexus_file) == ['005_chopper', '006_chopper']
+
+
+def test_instrument_classes_maps_members_to_nexus_classes(nexus_file):
+    from ess.spectroscopy import utils
+
+    classes = utils.instrument_classes(nexus_file)
+    assert classes == {name: nx_class for name, nx_class, _ in COMPONENTS}
+
+
+def test_source_position_follows_file_changes(nexus_file):
+    import os
+
+    name = ki.guess_source_name(nexus_file)
+    assert sc.identical(
+        ki.source_position(nexus_file, name), sc.vector([0, 0, 0.0], unit='m')
+    )
+    with h5py.File(nexus_file, 'r+') as f:
+        f[f'entry/instrument/{name}/transformations/translation'][()] = -1.5
+    stat = os.stat(nexus_file)
+    os.utime(nexus_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert sc.identical(
+        ki.source_position(nexus_file, name), sc.vector([0, 0, -1.5], unit='m')
+    )
+
+
+@pytest.mark.parametrize(
+    ('dtype', 'expected_dtype'),
+    [('float32', 'float32'), ('float64', 'float64'), ('int64', 'float64')],
+)
+def test_incident_conversions_preserve_event_dtype(dtype, expected_dtype):
+    time = sc.array(dims=['event'], values=[1, 2, 3], unit='ms', dtype=dtype)
+    slowness = ki.incident_slowness(
+        sc.scalar(10.0, unit='m'),
+        time,
+        sc.scalar(2.0, unit='m'),
+        sc.scalar(500.0, unit='us'),
+    )
+    wavenumber = ki.incident_wavenumber(slowness)
+    assert slowness.dtype == expected_dtype
+    assert ki.incident_wavelength(slowness).dtype == expected_dtype
+    assert wavenumber.dtype == expected_dtype
+    assert ki.incident_energy(wavenumber).dtype == expected_dtype
+    expected = sc.array(dims=['event'], values=[0.0625, 0.1875, 0.3125], unit='s/km')
+    assert sc.allclose(
+        slowness.to(unit='s/m', dtype='float64'), expected.to(unit='s/m')
+    )
+
+
+def test_incident_direction_is_not_shared_between_calls():
+    direction = ki.incident_direction()
+    direction *= -1
+    assert sc.identical(ki.incident_direction(), sc.vector([0, 0, 1.0]))
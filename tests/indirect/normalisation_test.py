@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 Scipp contributors (https://github.com/scipp)
+
+import scipp as sc
+
+from ess.spectroscopy.indirect import ki, normalisation
+
+
+def test_monitor_position(nexus_file):
+    position = normalisation.monitor_position(nexus_file, '110_frame_monitor')
+    assert sc.identical(position, sc.vector([0, 0, 150.0], unit='m'))
+
+
+def test_source_monitor_path_length_follows_guides(nexus_file):
+    source = ki.source_position(nexus_file, '001_source')
+    monitor = normalisation.monitor_position(nexus_file, '110_frame_monitor')
+    length = normalisation.source_monitor_path_length(nexus_file, source, monitor)
+    assert sc.identical(length, sc.scalar(150.0, unit='m'))
+
+
+def test_incident_monitor_normalization_looks_up_per_event_counts():
+    slow = 'slowness'
+    monitor = sc.DataArray(
+        sc.array(dims=[slow], values=[1.0, 2.0, 3.0]),
+        coords={slow: sc.array(dims=[slow], values=[0.0, 1, 2, 3], unit='s/m')},
+    )
+    slowness = sc.array(dims=['event'], values=[0.5, 2.5, 1.5], unit='s/m')
+    counts = normalisation.incident_monitor_normalization(slowness, monitor)
+    assert sc.identical(counts, sc.array(dims=['event'], values=[1.0, 3.0, 2.0]))
+
+
+def test_monitor_wall_time_renames_frame_time_dimension():
+    frame = 'frame_time'
+    monitor = sc.DataArray(
+        sc.array(dims=[frame], values=[1.0, 2.0, 3.0]),
+        coords={frame: sc.array(dims=[frame], values=[10.0, 20, 30], unit='ms')},
+    )
+    wall = normalisation.monitor_wall_time(
+        monitor, sc.scalar(14.0, unit='Hz'), sc.scalar(5.0, unit='ms')
+    )
+    assert wall.dims == ('wall_time',)
+    assert list(wall.coords) == ['wall_time']
+    assert sc.identical(wall.data, monitor.data.rename_dims({frame: 'wall_time'}))
+
+
+def test_normalise_looks_up_monitor_values_and_variances():
+    dim = 'incident_wavelength'
+    monitor = sc.DataArray(
+        sc.array(dims=[dim], values=[1.0, 2.0, 3.0], variances=[0.1, 0.2, 0.3]),
+        coords={dim: sc.array(dims=[dim], values=[0.0, 1, 2, 3], unit='angstrom')},
+    )
+    original = monitor.copy()
+    events = sc.DataArray(
+        sc.ones(dims=['event'], shape=[4]),
+        coords={
+            dim: sc.array(dims=['event'], values=[0.2, 1.2, 2.2, 2.7], unit='angstrom')
+        },
+    )
+    edges = sc.array(dims=[dim], values=[0.0, 1.5, 3.0], unit='angstrom')
+    binned = normalisation.normalise(events, monitor, edges)
+    counts = binned.coords['monitor']
+    assert sc.identical(
+        counts, sc.array(dims=[dim], values=[1.0, 3.0], variances=[0.1, 0.3])
+    )
+    assert sc.identical(monitor, original)
+
+
+def test_monitor_wavelength_matches_transform_coords():
+    from scipp.constants import Planck, neutron_mass
+
+    monitor = sc.DataArray(
+        sc.array(dims=['slowness'], values=[1.0, 2.0, 3.0]),
+        coords={
+            'slowness': sc.array(
+                dims=['slowness'], values=[1.0, 2.0, 3.0, 4.0], unit='ms/m'
+            )
+        },
+    )
+    expected = monitor.transform_coords(
+        incident_wavelength=lambda slowness: (Planck / neutron_mass * slowness).to(
+            unit='angstrom'
+        )
+    )
+    converted = normalisation.monitor_wavelength(monitor)
+    wavelength = 'incident_wavelength'
+    assert sc.allclose(converted.coords[wavelength], expected.coords[wavelength])
+    assert sc.identical(
+        converted.drop_coords(wavelength), expected.drop_coords(wavelength)
+    )
+    assert monitor.dims == ('slowness',)
+
+
+def test_normalise_treats_zero_monitor_variances_as_exact():
+    dim = 'incident_wavelength'
+    monitor = sc.DataArray(
+        sc.array(dims=[dim], values=[1.0, 2.0, 3.0], variances=[0.0, 0.0, 0.0]),
+        coords={dim: sc.array(dims=[dim], values=[0.0, 1, 2, 3], unit='angstrom')},
+    )
+    events = sc.DataArray(
+        sc.ones(dims=['event'], shape=[2]),
+        coords={dim: sc.array(dims=['event'], values=[0.2, 2.7], unit='angstrom')},
+    )
+    edges = sc.array(dims=[dim], values=[0.0, 1.5, 3.0], unit='angstrom')
+    counts = normalisation.normalise(events, monitor, edges).coords['monitor']
+    assert sc.identical(counts, sc.array(dims=[dim], values=[1.0, 3.0]))
@@ -0,0 +1,20 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 Scipp contributors (https://github.com/scipp)
+
+import scipp as sc
+
+from ess.spectroscopy.indirect import workflow
+
+
+def test_get_normalization_monitor_converts_frame_time_to_nanoseconds():
+    frame = 'frame_time'
+    monitor = sc.DataArray(
+        sc.array(dims=[frame], values=[1.0, 2.0, 3.0]),
+        coords={frame: sc.array(dims=[frame], values=[0.0, 1, 2, 3], unit='ms')},
+    )
+    converted = workflow.get_normalization_monitor({'monitor': monitor}, 'monitor')
+    assert sc.identical(converted.coords[frame], monitor.coords[frame].to(unit='ns'))
+    assert sc.identical(converted.data, monitor.data)
+    # already in nanoseconds, so nothing needs to be converted
+    again = workflow.get_normalization_monitor({'monitor': converted}, 'monitor')
+    assert again is converted
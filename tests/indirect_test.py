@@ -175,3 +175,75 @@ def test_sample_analyzer_vector():
     # as the x displacement increases, the y displacement should decrease
     frac = wires / (1.0 + sqrt(1.0 + (sc.norm(tubes) / scalar(1.0, unit='m')) ** 2))
     assert all_vectors_close(calculated, sample_analyzer_vec + frac)
+
+
+def test_final_wavenumber_follows_bragg_law():
+    from scipp import vectors
+
+    tau = scalar(1.87, unit='1/angstrom')
+    # 90 and 180 degree (back) scattering from the analyzer
+    sample_analyzer_vec = vectors(
+        dims=['pixel'], values=[[0, 0, 1.0], [0, 0, 1.0]], unit='m'
+    )
+    analyzer_detector_vec = vectors(
+        dims=['pixel'], values=[[0.5, 0, 0], [0, 0, -0.5]], unit='m'
+    )
+    calculated = secondary.final_wavenumber(
+        sample_analyzer_vec, analyzer_detector_vec, tau
+    )
+    theta = array(values=[45.0, 90.0], unit='deg', dims=['pixel'])
+    expected = tau / (2 * sc.sin(theta))
+    assert sc.allclose(calculated, expected)
+
+
+def test_detector_geometric_a4():
+    from scipp import vectors
+
+    vec = vectors(
+        dims=['pixel'],
+        values=[[0, 0, 1.0], [1.0, 0.2, 1.0], [-2.0, 0, 0], [0, 0.5, -1.0]],
+        unit='m',
+    )
+    expected = array(values=[0.0, 45.0, -90.0, 180.0], unit='deg', dims=['pixel'])
+    assert sc.allclose(secondary.detector_geometric_a4(vec), expected)
+
+
+def test_energy_transfer_from_wavenumbers():
+    from ess.spectroscopy.indirect import conservation
+    from ess.spectroscopy.indirect import ki as primary
+
+    ki = array(values=[2.0, 3.0], unit='1/angstrom', dims=['event'])
+    kf = array(values=[1.0, 1.5], unit='1/angstrom', dims=['event'])
+    expected = primary.incident_energy(ki) - secondary.final_energy(kf)
+    transfer = conservation.energy(ki, kf)
+    assert transfer.unit == 'meV'
+    assert sc.allclose(transfer, expected)
+
+
+def test_energy_transfer_matches_scipp_constants():
+    from scipp.constants import hbar, neutron_mass
+
+    from ess.spectroscopy.indirect import conservation
+
+    ki = array(values=[1.0, 2.0, 3.0], unit='1/angstrom', dims=['event'])
+    kf = array(values=[0.0, 1.0, 1.5], unit='1/angstrom', dims=['event'])
+    expected = (hbar * hbar * (ki * ki - kf * kf) / 2 / neutron_mass).to(unit='meV')
+    transfer = conservation.energy(ki, kf)
+    assert sc.allclose(transfer, expected)
+    # a neutron with k = 1/angstrom has an energy of about 2.0721 meV
+    assert sc.allclose(
+        transfer['event', 0], scalar(2.0721, unit='meV'), rtol=scalar(1e-4)
+    )
+
+
+def test_energy_transfer_broadcasts_wavenumbers():
+    from ess.spectroscopy.indirect import conservation
+    from ess.spectroscopy.indirect import ki as primary
+
+    kf = array(values=[1.0, 1.5], unit='1/angstrom', dims=['pixel'])
+    for ki in (
+        scalar(2.0, unit='1/angstrom'),
+        array(values=[2.0, 3.0], unit='1/angstrom', dims=['event']),
+    ):
+        expected = primary.incident_energy(ki) - secondary.final_energy(kf)
+        assert sc.allclose(conservation.energy(ki, kf), expected)